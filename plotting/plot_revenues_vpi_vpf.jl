@@ -4,13 +4,12 @@ using CairoMakie
 using JLD2
 
 function _sort_bess_capacities(data::DataFrame)
-    for cap in ("12.5MW", "25.0MW", "50.0MW")
-        data[:, :sim] = replace.(data[:, :sim], cap => lpad(cap, 7, "0"))
-    end
-    sort!(data, :sim)
-    for cap in ("012.5MW", "025.0MW", "050.0MW")
-        data[:, :sim] = replace.(data[:, :sim], cap => cap[2:end])
+    # sims are of the form "actual/12.5MW", so sort by data type then numeric capacity
+    function _sim_sort_key(sim::AbstractString)
+        (data_type, mw) = split(sim, "/")
+        return (data_type, parse(Float64, replace(mw, "MW" => "")))
     end
+    sort!(data, :sim; by=_sim_sort_key)
     return data
 end
 
@@ -20,14 +19,13 @@ function _get_revenue_summary_data(data::Dict{String,Any})
     lookaheads = []
     for key in keys(data)
         df = data[key]
-        for lookahead in unique(df.lookahead_minutes)
-            lookahead_df = df[df.lookahead_minutes .== lookahead, :]
-            lookahead_df = lookahead_df[lookahead_df.status .== "binding", :]
-            revenue = sum(lookahead_df.revenue)
-            push!(revenues, revenue)
-            push!(bess_type, key)
-            push!(lookaheads, lookahead)
-        end
+        binding_df = df[df.status .== "binding", [:lookahead_minutes, :revenue]]
+        lookahead_revenues = combine(
+            groupby(binding_df, :lookahead_minutes; sort=false), :revenue => sum => :revenue
+        )
+        append!(revenues, lookahead_revenues.revenue)
+        append!(bess_type, fill(key, size(lookahead_revenues, 1)))
+        append!(lookaheads, lookahead_revenues.lookahead_minutes)
     end
     summary_data = DataFrame(
         :revenue => revenues,
@@ -42,7 +40,7 @@ function _get_revenue_summary_data(data::Dict{String,Any})
 end
 
 function plot_revenues_across_simulations(
-    jld2_path::String, title::String; percentage_of_perfect_foresight=false
+    data::Dict{String,Any}, title::String; percentage_of_perfect_foresight=false
 )
     function _makie_plot(
         plot_data::DataFrame,
@@ -79,7 +77,6 @@ function plot_revenues_across_simulations(
         return fig
     end
 
-    data = load(jld2_path)
     plot_data = _get_revenue_summary_data(data)
     if percentage_of_perfect_foresight
         unstacked = unstack(plot_data, :sim, :lookahead, :revenue)
@@ -105,7 +102,7 @@ function plot_revenues_across_simulations(
 end
 
 function plot_value_of_information_and_foresight(
-    jld2_path::String, title::String; percentage_of_perfect_foresight=false
+    data::Dict{String,Any}, title::String; percentage_of_perfect_foresight=false
 )
     function _makie_plot(
         plot_data::DataFrame,
@@ -171,7 +168,6 @@ function plot_value_of_information_and_foresight(
         return fig
     end
 
-    data = load(jld2_path)
     df = _get_revenue_summary_data(data)
     actual_caps = [cap[2] for cap in split.(unique(df.sim), "/") if cap[1] == "actual"]
     forecast_caps = [cap[2] for cap in split.(unique(df.sim), "/") if cap[1] == "forecast"]
@@ -179,24 +175,20 @@ function plot_value_of_information_and_foresight(
     lookaheads = [lk for lk in unique(df.lookahead) if lk != "Perfect Foresight"]
     (xticklabels, groups) = (String[], String[])
     (v_pis, v_pfs) = (Float64[], Float64[])
+    revenue_lookup = Dict(zip(zip(df.sim, df.lookahead), df.revenue))
     for cap in caps
+        pf_rev = revenue_lookup[("actual/$cap", "Perfect Foresight")]
         for lookahead in lookaheads
-            lk_mask = df.lookahead .== lookahead
-            pf_rev = df[
-                (df.sim .== "actual/$cap") .& (df.lookahead .== "Perfect Foresight"),
-                :revenue,
-            ]
-            pi_rev = df[(df.sim .== "actual/$cap") .& lk_mask, :revenue]
-            v_pi = pi_rev - df[(df.sim .== "forecast/$cap") .& lk_mask, :revenue]
-            v_pf = pf_rev - df[(df.sim .== "forecast/$cap") .& lk_mask, :revenue]
+            pi_rev = revenue_lookup[("actual/$cap", lookahead)]
+            forecast_rev = revenue_lookup[("forecast/$cap", lookahead)]
+            (v_pi, v_pf) = (pi_rev - forecast_rev, pf_rev - forecast_rev)
             if percentage_of_perfect_foresight
-                v_pi = @. v_pi / pf_rev * 100
-                v_pf = @. v_pf / pf_rev * 100
+                (v_pi, v_pf) = (v_pi / pf_rev * 100, v_pf / pf_rev * 100)
             end
             push!(xticklabels, cap)
             push!(groups, lookahead)
-            push!(v_pis, v_pi[])
-            push!(v_pfs, v_pf[])
+            push!(v_pis, v_pi)
+            push!(v_pfs, v_pf)
         end
     end
     plot_data = DataFrame(
@@ -222,14 +214,15 @@ function plot_standardarb_nodeg()
     jld2_file = joinpath(
         results_path, "NSW_100.0MWh_StandardArb_NoDeg_2021_lookaheads.jld2"
     )
-    abs_revenues = plot_revenues_across_simulations(jld2_file, title)
+    data = load(jld2_file)
+    abs_revenues = plot_revenues_across_simulations(data, title)
     save(
         joinpath(plot_path, "NSW_100.0MWh_StandardArb_NoDeg_2021_revenues_lookaheads.pdf"),
         abs_revenues;
         pt_per_unit=1,
     )
     percentage_revenues = plot_revenues_across_simulations(
-        jld2_file, title, ; percentage_of_perfect_foresight=true
+        data, title, ; percentage_of_perfect_foresight=true
     )
     save(
         joinpath(
@@ -240,7 +233,7 @@ function plot_standardarb_nodeg()
         pt_per_unit=1,
     )
     per_vpf_vpi = plot_value_of_information_and_foresight(
-        jld2_file, title, ; percentage_of_perfect_foresight=true
+        data, title, ; percentage_of_perfect_foresight=true
     )
     save(
         joinpath(plot_path, "NSW_100.0MWh_StandardArb_NoDeg_2021_percentage_vpf_vpi.pdf"),
@@ -260,7 +253,8 @@ function plot_standardarb_throughput_limits()
     jld2_file = joinpath(
         results_path, "NSW_100.0MWh_ArbThroughputLimits_NoDeg_2021_lookaheads.jld2"
     )
-    abs_revenues = plot_revenues_across_simulations(jld2_file, title)
+    data = load(jld2_file)
+    abs_revenues = plot_revenues_across_simulations(data, title)
     save(
         joinpath(
             plot_path, "NSW_100.0MWh_ArbThroughputLimits_NoDeg_2021_revenues_lookaheads.pdf"
@@ -269,7 +263,7 @@ function plot_standardarb_throughput_limits()
         pt_per_unit=1,
     )
     percentage_revenues = plot_revenues_across_simulations(
-        jld2_file, title; percentage_of_perfect_foresight=true
+        data, title; percentage_of_perfect_foresight=true
     )
     save(
         joinpath(
@@ -280,7 +274,7 @@ function plot_standardarb_throughput_limits()
         pt_per_unit=1,
     )
     per_vpf_vpi = plot_value_of_information_and_foresight(
-        jld2_file, title; percentage_of_perfect_foresight=true
+        data, title; percentage_of_perfect_foresight=true
     )
     save(
         joinpath(
@@ -300,11 +294,12 @@ function plot_standardarb_throughput_penalty()
     end
     for file in [f for f in readdir(results_path) if endswith(f, ".jld2")]
         jld2_file = joinpath(results_path, file)
+        data = load(jld2_file)
         throughput_penalty = match(r".*_ArbThroughputPenalty([0-9.]*)_.*", file)[1]
         throughput_penalty = string(round(Int, parse(Float64, throughput_penalty)))
         throughput_penalty = throughput_penalty[1:3] * "," * throughput_penalty[4:end]
         title = "100MWh BESS - TP Penalty $(throughput_penalty) AUD/MWh - NSW Prices 2021"
-        abs_revenues = plot_revenues_across_simulations(jld2_file, title)
+        abs_revenues = plot_revenues_across_simulations(data, title)
         save(
             joinpath(
                 plot_path,
@@ -314,7 +309,7 @@ function plot_standardarb_throughput_penalty()
             pt_per_unit=1,
         )
         percentage_revenues = plot_revenues_across_simulations(
-            jld2_file, title; percentage_of_perfect_foresight=true
+            data, title; percentage_of_perfect_foresight=true
         )
         save(
             joinpath(
@@ -325,7 +320,7 @@ function plot_standardarb_throughput_penalty()
             pt_per_unit=1,
         )
         per_vpf_vpi = plot_value_of_information_and_foresight(
-            jld2_file, title; percentage_of_perfect_foresight=true
+            data, title; percentage_of_perfect_foresight=true
         )
         save(
             joinpath(
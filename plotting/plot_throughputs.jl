@@ -5,13 +5,12 @@ using JLD2
 using Statistics
 
 function _sort_bess_capacities(data::DataFrame)
-    for cap in ("12.5MW", "25.0MW", "50.0MW")
-        data[:, :sim] = replace.(data[:, :sim], cap => lpad(cap, 7, "0"))
-    end
-    sort!(data, :sim)
-    for cap in ("012.5MW", "025.0MW", "050.0MW")
-        data[:, :sim] = replace.(data[:, :sim], cap => cap[2:end])
+    # sims are of the form "actual/12.5MW", so sort by data type then numeric capacity
+    function _sim_sort_key(sim::AbstractString)
+        (data_type, mw) = split(sim, "/")
+        return (data_type, parse(Float64, replace(mw, "MW" => "")))
     end
+    sort!(data, :sim; by=_sim_sort_key)
     return data
 end
 
@@ -23,7 +22,7 @@ function _get_throughput_data(data::Dict{String,Any})
         df[:, :sim] .= key
         push!(throughput_data, df)
     end
-    return vcat(throughput_data...)
+    return reduce(vcat, throughput_data)
 end
 
 function plot_throughputs(data::Dict{String,Any}, sim::String, title::String)
@@ -38,20 +37,23 @@ function plot_throughputs(data::Dict{String,Any}, sim::String, title::String)
     for (i, lk) in enumerate(lookaheads)
         label = replace("$lk", "526500" => "Perfect Foresight")
         plot_df = filter(:lookahead_minutes => x -> x == lk, sim_data)
-        lines!(ax, plot_df.throughput_mwh; label=label, color=colors[i])
+        # plot hourly points (every 12 x 5-minute intervals) at their original x positions,
+        # always including the last point so the year-end throughput is drawn
+        plot_index = unique([1:12:nrow(plot_df); nrow(plot_df)])
+        lines!(
+            ax,
+            plot_index,
+            plot_df.throughput_mwh[plot_index];
+            label=label,
+            color=colors[i],
+        )
     end
     xticks = unique(sim_data.simulated_time)
-    lines!(
-        ax,
-        fill(100.0 * 365, length(xticks));
-        color=:red,
-        linestyle=:dot,
-        label="1 cycle per day",
-    )
+    hlines!(ax, 100.0 * 365; color=:red, linestyle=:dot, label="1 cycle per day")
     fig[1, 2] = Legend(
         fig, ax, "Lookaheads\n(minutes)"; framevisible=false, patchcolor="#f0f0f0"
     )
-    month_start_index = [findfirst(x -> month(x) == i, xticks) for i in 1:12]
+    month_start_index = indexin(1:12, month.(xticks))
     month_start_label = [string(Date(xticks[x])) for x in month_start_index]
     ax.xticks = (month_start_index, month_start_label)
     ax.xticklabelrotation = π / 4
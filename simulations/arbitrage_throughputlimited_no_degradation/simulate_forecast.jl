@@ -20,11 +20,12 @@ function collate_all_actual_and_forecast_data(
 )
     @info("Collating forecast data")
     all_actual_data = NEMStorageUnderUncertainty.get_all_actual_data("data/dispatch_price")
-    (pd_df, p5_df) = NEMStorageUnderUncertainty.get_all_pd_and_p5_data(
-        "data/forecast_price/PREDISPATCH", "data/forecast_price/P5MIN"
-    )
-    forecast_data = NEMStorageUnderUncertainty.get_ForecastData(
-        pd_df, p5_df, region, (start_time, end_time), nothing
+    forecast_data = NEMStorageUnderUncertainty.get_cached_ForecastData(
+        "data/forecast_price/PREDISPATCH",
+        "data/forecast_price/P5MIN",
+        region,
+        (start_time, end_time),
+        "data/forecast_data_cache",
     )
     return all_actual_data, forecast_data
 end
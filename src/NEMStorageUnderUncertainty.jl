@@ -13,7 +13,6 @@ using DataFrames
 using Dates
 using Impute: Impute
 using JuMP: JuMP
-using Logging
 using ProgressMeter
 using JLD2
 
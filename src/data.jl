@@ -1,10 +1,11 @@
 function _get_times_frequency_in_hours(times::Vector{DateTime})
-    unique_diffs = unique([times[i] - times[i - 1] for i in range(2, length(times))])
-    if length(unique_diffs) > 1
-        throw(ArgumentError("Times should have a consistent frequency"))
-    else
-        return Minute(unique_diffs[]).value / 60.0
+    freq = times[2] - times[1]
+    for i in range(3, length(times))
+        if times[i] - times[i - 1] != freq
+            throw(ArgumentError("Times should have a consistent frequency"))
+        end
     end
+    return Minute(freq).value / 60.0
 end
 
 ####### TYPES #######
@@ -52,11 +53,12 @@ function get_all_actual_data(path::String)
     if !any([occursin(".parquet", file) for file in readdir(path)])
         thow(ArgumentError("$path does not contain *.parquet"))
     end
-    actual_data = DataFrame(read_parquet(path))
-    filter!(:INTERVENTION => x -> x == 0, actual_data)
-    actual_data = actual_data[:, [:SETTLEMENTDATE, :REGIONID, :RRP]]
+    actual_data = DataFrame(read_parquet(path); copycols=false)
+    actual_data = actual_data[
+        actual_data.INTERVENTION .== 0, [:SETTLEMENTDATE, :REGIONID, :RRP]
+    ]
     actual_data[!, :SETTLEMENTDATE] =
-        DateTime.(actual_data[!, :SETTLEMENTDATE], "yyyy/mm/dd HH:MM:SS")
+        DateTime.(actual_data[!, :SETTLEMENTDATE], dateformat"yyyy/mm/dd HH:MM:SS")
     return actual_data
 end
 
@@ -85,13 +87,12 @@ function get_ActualData(
     region::String,
     actual_time_window::Union{Nothing,Tuple{DateTime,DateTime}}=nothing,
 )
-    actual_df = copy(actual_data)
     if region ∉ ("QLD1", "NSW1", "VIC1", "SA1", "TAS1")
         throw(ArgumentError("Invalid region"))
     end
-    disallowmissing!(actual_df)
     @debug "Filtering actual prices by region"
-    filter!(:REGIONID => x -> x == region, actual_df)
+    actual_df = actual_data[actual_data.REGIONID .== region, :]
+    disallowmissing!(actual_df)
     τ = _get_times_frequency_in_hours(actual_df.SETTLEMENTDATE)
     if !isnothing(actual_time_window)
         @debug "Filtering actual prices by time"
@@ -133,16 +134,17 @@ function get_all_pd_and_p5_data(pd_path::String, p5_path::String)
             thow(ArgumentError("$path does not contain *.parquet"))
         end
     end
-    pd_data = DataFrame(read_parquet(pd_path))
+    forecast_cols = [:run_time, :forecasted_time, :REGIONID, :RRP]
+    pd_data = DataFrame(read_parquet(pd_path); copycols=false)
     rename!(pd_data, :PREDISPATCH_RUN_DATETIME => :run_time, :DATETIME => :forecasted_time)
-    p5_data = DataFrame(read_parquet(p5_path))
+    pd_data = pd_data[pd_data.INTERVENTION .== 0, forecast_cols]
+    p5_data = DataFrame(read_parquet(p5_path); copycols=false)
     rename!(p5_data, :RUN_DATETIME => :run_time, :INTERVAL_DATETIME => :forecasted_time)
+    p5_data = p5_data[p5_data.INTERVENTION .== 0, forecast_cols]
     # unix2datetime converts unix epoch to DateTime
-    for data in (p5_data, pd_data)
-        filter!(:INTERVENTION => x -> x == 0, data)
-        data[!, [:run_time, :forecasted_time]] = # convert microseconds to seconds
-            unix2datetime.(data[!, [:run_time, :forecasted_time]] ./ 10^6)
-        select!(data, :run_time, :forecasted_time, :REGIONID, :RRP)
+    # convert microseconds to seconds
+    for data in (p5_data, pd_data), col in (:run_time, :forecasted_time)
+        data[!, col] = unix2datetime.(data[!, col] ./ 10^6)
     end
     return (pd_data, p5_data)
 end
@@ -171,12 +173,12 @@ Imputation is carried out using `Impute.jl`.
 Imputed PD DataFrame
 """
 function _impute_predispatch_data(regional_pd_data::DataFrame)
-    run_times = unique(regional_pd_data.actual_run_time)
+    run_time_groups = groupby(regional_pd_data, :actual_run_time; sort=false)
     all_runtime_data = DataFrame[]
-    p = Progress(length(run_times), "Imputing predispatch data")
-    for run_time in run_times
+    p = Progress(length(run_time_groups), "Imputing predispatch data")
+    for run_time_data in run_time_groups
         # isolate data for one run time
-        run_time_data = filter(:actual_run_time => x -> x == run_time, regional_pd_data)
+        run_time = run_time_data.actual_run_time[1]
         # generate forecasted time at 5 minute frequency
         fill_forecasted_times = Vector(
             range(
@@ -208,13 +210,12 @@ function _impute_predispatch_data(regional_pd_data::DataFrame)
         end
         next!(p)
     end
-    return vcat(all_runtime_data...)
+    return reduce(vcat, all_runtime_data)
 end
 
 function _drop_overlapping_PD_forecasts(pd_data::DataFrame)
-    pd_data[!, :ahead_time] = pd_data.forecasted_time .- pd_data.actual_run_time
-    filtered_pd_data = filter(:ahead_time => dt -> dt > Hour(1), pd_data)
-    return filtered_pd_data
+    ahead_times = pd_data.forecasted_time .- pd_data.actual_run_time
+    return pd_data[ahead_times .> Hour(1), :]
 end
 
 function _concatenate_forecast_data(pd_data::DataFrame, p5_data::DataFrame)
@@ -309,18 +310,16 @@ function get_ForecastData(
     run_time_window::Union{Nothing,Tuple{DateTime,DateTime}}=nothing,
     forecasted_time_window::Union{Nothing,Tuple{DateTime,DateTime}}=nothing,
 )
-    (pd_df, p5_df) = (copy(pd_data), copy(p5_data))
     if region ∉ ("QLD1", "NSW1", "VIC1", "SA1", "TAS1")
         throw(ArgumentError("Invalid region"))
     end
     @debug "Filtering PD and P5 DataFrames by region"
-    for df in (pd_df, p5_df)
-        filter!(:REGIONID => x -> x == region, df)
-    end
+    (pd_df, p5_df) = (df[df.REGIONID .== region, :] for df in (pd_data, p5_data))
     @debug "Calculating actual run times and dropping original run time col"
     for (df, minutes) in zip((pd_df, p5_df), (30, 5))
-        df[!, :actual_run_time] = df[!, :run_time] .- Minute(minutes)
-        select!(df, Not(:run_time))
+        # masked indexing returns copies, so run times can be shifted in place
+        df.run_time .-= Minute(minutes)
+        rename!(df, :run_time => :actual_run_time)
     end
     @debug "Imputing predispatch data"
     imputed_pd_df = _impute_predispatch_data(pd_df)
@@ -368,3 +367,71 @@ function Base.convert(::Type{T}, forecast::ForecastData) where {T<:DataFrame}
         :region => fill(forecast.region, length(forecast.prices)),
     )
 end
+
+"""
+Version of the compiled forecast data cached by [`get_cached_ForecastData`](@ref).
+
+Increment this whenever [`get_all_pd_and_p5_data`](@ref) or [`get_ForecastData`](@ref)
+change the compiled forecast data so that existing caches are not reused.
+"""
+const FORECAST_CACHE_VERSION = 1
+
+function _get_latest_parquet_mtime(paths::String...)
+    parquet_mtimes = [
+        mtime(joinpath(root, file)) for path in paths for
+        (root, _, files) in walkdir(path) for file in files if endswith(file, ".parquet")
+    ]
+    return round(Int, maximum(parquet_mtimes; init=0.0))
+end
+
+"""
+Get a [`ForecastData`](@ref) instance, loading it from a JLD2 cache if possible.
+
+Compiling and imputing forecast data is slow, so the result of
+[`get_ForecastData`](@ref) is cached in `cache_path`. Cache files are keyed on the
+region, the run time window, [`FORECAST_CACHE_VERSION`](@ref) and the latest
+modification time of the `PREDISPATCH` and `P5MIN` parquet files. If no cache matches,
+stale caches for the region and run time window are removed and the forecast data is
+compiled and cached.
+
+# Arguments:
+
+  - `pd_path`: Path to `PREDISPATCH` parquet partitions
+  - `p5_path`: Path to `P5MIN` parquet partitions
+  - `region`: Market region in the NEM
+  - `run_time_window`: Tuple used to filter DataFrame based on run times
+  - `cache_path`: Directory used to cache compiled forecast data
+
+# Returns:
+ An [`ForecastData`](@ref) instance.
+"""
+function get_cached_ForecastData(
+    pd_path::String,
+    p5_path::String,
+    region::String,
+    run_time_window::Tuple{DateTime,DateTime},
+    cache_path::String,
+)
+    cache_prefix = "$(region)_" * join(Dates.format.(run_time_window, "yyyymmddHHMM"), "_")
+    input_mtime = _get_latest_parquet_mtime(pd_path, p5_path)
+    cache_file = joinpath(
+        cache_path, "$(cache_prefix)_v$(FORECAST_CACHE_VERSION)_$(input_mtime).jld2"
+    )
+    if isfile(cache_file)
+        @info("Loading cached forecast data from $cache_file")
+        return jldopen(f -> f["forecast_data"], cache_file, "r")
+    end
+    (pd_df, p5_df) = get_all_pd_and_p5_data(pd_path, p5_path)
+    forecast_data = get_ForecastData(pd_df, p5_df, region, run_time_window, nothing)
+    mkpath(cache_path)
+    for file in readdir(cache_path)
+        if startswith(file, "$(cache_prefix)_v") && endswith(file, ".jld2")
+            @info("Removing stale forecast data cache $file")
+            rm(joinpath(cache_path, file))
+        end
+    end
+    jldopen(cache_file, "w"; compress=true) do f
+        f["forecast_data"] = forecast_data
+    end
+    return forecast_data
+end
@@ -19,21 +19,31 @@ function calculate_actual_revenue(
     sim_results::DataFrame, actual_price_data::DataFrame, τ::Float64
 )
     sort!(sim_results, :simulated_time)
-    sort!(actual_price_data, :SETTLEMENTDATE)
+    (sim_start, sim_end) = (sim_results.simulated_time[1], sim_results.simulated_time[end])
+    (price_start, price_end) = extrema(actual_price_data.SETTLEMENTDATE)
     @assert(
-        actual_price_data.SETTLEMENTDATE[1] ≤ sim_results.simulated_time[1],
+        price_start ≤ sim_start,
         "Actual price data starts after the first simulated datetime"
     )
     @assert(
-        actual_price_data.SETTLEMENTDATE[end] ≥ sim_results.simulated_time[end],
+        price_end ≥ sim_end,
         "Actual price data ends before the last simulated datetime"
     )
-    actual_price_data = rename(
-        actual_price_data, :SETTLEMENTDATE => :simulated_time, :RRP => :actual_price
+    # prices are looked up in sim_results row order so nonbinding_mask stays aligned
+    sim_regions = unique(sim_results.REGIONID)
+    in_sim = @. (sim_start ≤ actual_price_data.SETTLEMENTDATE ≤ sim_end) &
+        in(actual_price_data.REGIONID, (sim_regions,))
+    sim_price_data = actual_price_data[in_sim, :]
+    price_lookup = Dict(
+        zip(zip(sim_price_data.SETTLEMENTDATE, sim_price_data.REGIONID), sim_price_data.RRP)
     )
-    merged = leftjoin(sim_results, actual_price_data; on=[:simulated_time, :REGIONID])
+    merged = copy(sim_results)
+    merged[!, :actual_price] = [
+        get(price_lookup, key, missing) for
+        key in zip(merged.simulated_time, merged.REGIONID)
+    ]
     merged[!, :revenue] =
-        merged[!, :actual_price] .* (merged[!, :discharge_mw] .- merged[!, :charge_mw]) * τ
+        @. merged[!, :actual_price] * (merged[!, :discharge_mw] - merged[!, :charge_mw]) * τ
     nonbinding_mask = sim_results.status .== "non binding"
     if !isempty(nonbinding_mask)
         allowmissing!(merged)
@@ -86,6 +86,47 @@ function _get_periods_for_simulation(
     return period_data
 end
 
+function _get_first_index_for_time(vec::Vector{DateTime}, dt::DateTime)
+    return findfirst(t -> t == dt, vec)
+end
+
+function _validate_time_inputs(
+    data::ForecastData,
+    decision_start_time::DateTime,
+    decision_end_time::DateTime,
+    horizon::Period,
+)
+    (run_times, forecasted_times) = (data.run_times, data.forecasted_times)
+    @assert(
+        !isnothing(_get_first_index_for_time(run_times, decision_start_time)),
+        "First decision time $(decision_start_time) not in data.run_times"
+    )
+    @assert(
+        !isnothing(_get_first_index_for_time(run_times, decision_end_time)),
+        "Last decision time $(decision_end_time) not in data.run_times"
+    )
+    @assert(
+        !isnothing(
+            _get_first_index_for_time(forecasted_times, decision_end_time + horizon)
+        ),
+        (
+            "Data insufficient to run final decision point at $(decision_end_time)" *
+            " (forecasted data should go up to $(decision_end_time + horizon))"
+        )
+    )
+    return run_times, forecasted_times
+end
+
+function _create_run_time_index_ref(data::ForecastData, decision_end_time::DateTime)
+    # run times are sorted, so the first index of each run time is where it changes
+    run_times = data.run_times
+    return [
+        i for i in eachindex(run_times) if
+        (i == 1 || run_times[i] != run_times[i - 1]) &&
+        run_times[i] ≤ decision_end_time
+    ]
+end
+
 """
 Gets decision points, binding intervals and horizon ends given [`ForecastData`](@ref) and
 simulation parameters.
@@ -120,46 +161,10 @@ function _get_periods_for_simulation(
     horizon::T,
     data::ForecastData,
 ) where {T<:Period}
-    function _validate_time_inputs(
-        data::ForecastData, decision_start_time::DateTime, decision_end_time::DateTime
-    )
-        (run_times, forecasted_times) = (data.run_times, data.forecasted_times)
-        @assert(
-            !isnothing(_get_first_index_for_time(run_times, decision_start_time)),
-            "First decision time $(decision_start_time) not in data.run_times"
-        )
-        @assert(
-            !isnothing(_get_first_index_for_time(run_times, decision_end_time)),
-            "Last decision time $(decision_end_time) not in data.run_times"
-        )
-        @assert(
-            !isnothing(
-                _get_first_index_for_time(forecasted_times, decision_end_time + horizon)
-            ),
-            (
-                "Data insufficient to run final decision point at $(decision_end_time)" *
-                " (forecasted data should go up to $(decision_end_time + horizon))"
-            )
-        )
-        return run_times, forecasted_times
-    end
-
-    function _get_first_index_for_time(vec::Vector{DateTime}, dt::DateTime)
-        return findfirst(t -> t == dt, vec)
-    end
-
-    function _create_run_time_index_ref(data::ForecastData, decision_end_time::DateTime)
-        df = convert(DataFrame, data)
-        df[!, :index] = 1:size(df)[1]
-        first_idx = combine(groupby(df, :actual_run_times), :index => first)
-        filter!(:actual_run_times => dt -> dt ≤ decision_end_time, first_idx)
-        return first_idx[!, :index_first]
-    end
-
     @assert(data.run_time_aligned, "ForecastData should be aligned by run times")
     interval_length = Minute(Int64(data.τ * 60.0))
     (run_times, forecasted_times) = _validate_time_inputs(
-        data, decision_start_time, decision_end_time
+        data, decision_start_time, decision_end_time, horizon
     )
     (decision_start, decision_end) = (
         _get_first_index_for_time(run_times, decision_start_time),
@@ -223,12 +228,13 @@ function _retrieve_results(
     m::JuMP.Model, decision_time::DateTime, binding_start::DateTime, binding_end::DateTime
 )
     vars = (:charge_mw, :discharge_mw, :soc_mwh, :throughput_mwh, :charge_state)
-    var_solns = Vector{DataFrame}(undef, length(vars))
-    for (i, var) in enumerate(vars)
-        table = JuMP.Containers.rowtable(JuMP.value.(m[var]); header=[:simulated_time, var])
-        var_solns[i] = DataFrame(table)
+    var_solns = [JuMP.value.(m[var]) for var in vars]
+    simulated_times = axes(var_solns[1], 1)
+    @assert all(axes(v, 1) == simulated_times for v in var_solns)
+    results = DataFrame(:simulated_time => collect(simulated_times))
+    for (var, var_soln) in zip(vars, var_solns)
+        results[!, var] = Array(var_soln)
     end
-    results = innerjoin(var_solns...; on=:simulated_time)
     results[:, :decision_time] .= decision_time
     binding = results[binding_start .≤ results.simulated_time .≤ binding_end, :]
     binding[:, :status] .= "binding"
@@ -281,7 +287,8 @@ Simulate storage operation using actual data
   * `binding`: Binding horizon, out from `decision_start_time`
   * `horizon`: Model lookahead horizon, out from `decision_start_time`
   * `capture_all_decisions`: Default false. If true, report non binding decisions in results
-  * `silent`: default `false`. `true` to suppress solver output
+  * `silent`: default `true`. `true` to suppress solver output and the simulation info
+    message
   * `time_limit_sec`: default `nothing`. `Float64` to impose solver time limit in seconds
   * `string_names`: default `true`. `false` to disable JuMP string names
   * `relative_gap_in_results`: default false. If true, adds a column with relative MIP gap
@@ -311,20 +318,19 @@ function simulate_storage_operation(
     @assert(
         decision_start_time ≤ decision_end_time, "Decision start time ≤ decision end time"
     )
-    if silent
-        disable_logging(Logging.Info)
-    end
     (times, prices) = (data.times, data.prices)
     sim_periods = _get_periods_for_simulation(
         decision_start_time, decision_end_time, binding, horizon, data
     )
-    @info("""
-        Running actual data simulation with $model_formulation and $degradation:
-            decision_start_time: $decision_start_time
-            decision_end_time: $decision_end_time
-            binding: $binding
-            horizon: $horizon
-            """)
+    if !silent
+        @info("""
+            Running actual data simulation with $model_formulation and $degradation:
+                decision_start_time: $decision_start_time
+                decision_end_time: $decision_end_time
+                binding: $binding
+                horizon: $horizon
+                """)
+    end
     binding_results = Vector{DataFrame}(undef, size(sim_periods)[1])
     if capture_all_decisions
         non_binding_results = Vector{DataFrame}(undef, size(sim_periods)[1])
@@ -366,11 +372,11 @@ function simulate_storage_operation(
         next!(p)
     end
     if capture_all_decisions
-        non_binding_df = vcat(non_binding_results...)
-        binding_df = vcat(binding_results...)
+        non_binding_df = reduce(vcat, non_binding_results)
+        binding_df = reduce(vcat, binding_results)
         results_df = sort!(vcat(binding_df, non_binding_df), :decision_time)
     else
-        results_df = vcat(binding_results...)
+        results_df = reduce(vcat, binding_results)
     end
     results_df[:, :lookahead_minutes] .= Dates.value(Minute(horizon))
     results_df[:, :REGIONID] .= data.region
@@ -392,7 +398,8 @@ Simulate storage operation using forecast data
   * `binding`: Binding horizon, out from `decision_start_time`
   * `horizon`: Model lookahead horizon, out from `decision_start_time`
   * `capture_all_decisions`: Default false. If true, report non binding decisions in results
-  * `silent`: default `false`. `true` to suppress solver output
+  * `silent`: default `true`. `true` to suppress solver output and the simulation info
+    message
   * `time_limit_sec`: default `nothing`. `Float64` to impose solver time limit in seconds
   * `string_names`: default `true`. `false` to disable JuMP string names
   * `relative_gap_in_results`: default false. If true, adds a column with relative MIP gap
@@ -422,22 +429,21 @@ function simulate_storage_operation(
     @assert(
         decision_start_time ≤ decision_end_time, "Decision start time ≤ decision end time"
     )
-    if silent
-        disable_logging(Logging.Info)
-    end
     (run_times, forecasted_times, prices) = (
         data.run_times, data.forecasted_times, data.prices
     )
     sim_periods = _get_periods_for_simulation(
         decision_start_time, decision_end_time, binding, horizon, data
     )
-    @info("""
-        Running forecast data simulation with $model_formulation and $degradation:
-            decision_start_time: $decision_start_time
-            decision_end_time: $decision_end_time
-            binding: $binding
-            horizon: $horizon
-            """)
+    if !silent
+        @info("""
+            Running forecast data simulation with $model_formulation and $degradation:
+                decision_start_time: $decision_start_time
+                decision_end_time: $decision_end_time
+                binding: $binding
+                horizon: $horizon
+                """)
+    end
     binding_results = Vector{DataFrame}(undef, size(sim_periods)[1])
     if capture_all_decisions
         non_binding_results = Vector{DataFrame}(undef, size(sim_periods)[1])
@@ -479,11 +485,11 @@ function simulate_storage_operation(
         next!(p)
     end
     if capture_all_decisions
-        non_binding_df = vcat(non_binding_results...)
-        binding_df = vcat(binding_results...)
+        non_binding_df = reduce(vcat, non_binding_results)
+        binding_df = reduce(vcat, binding_results)
         results_df = sort!(vcat(binding_df, non_binding_df), :decision_time)
     else
-        results_df = vcat(binding_results...)
+        results_df = reduce(vcat, binding_results)
     end
     results_df[:, :lookahead_minutes] .= Dates.value(Minute(horizon))
     results_df[:, :REGIONID] .= data.region
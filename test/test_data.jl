@@ -1,6 +1,7 @@
 using NEMStorageUnderUncertainty: NEMStorageUnderUncertainty
 using Dates
 using DataFrames
+using JLD2
 using Logging
 using Test
 
@@ -19,6 +20,19 @@ using Test
     @test actual_data.times[end] == DateTime(2021, 12, 5, 12, 30, 0)
 end
 
+@testset "Run Time Frequency Tests" begin
+    start_time = DateTime(2021, 1, 1, 0, 0, 0)
+    regular_times = collect(start_time:Minute(5):(start_time + Hour(1)))
+    @test NEMStorageUnderUncertainty._get_times_frequency_in_hours(regular_times) ==
+        5 / 60
+    two_times = [start_time, start_time + Minute(30)]
+    @test NEMStorageUnderUncertainty._get_times_frequency_in_hours(two_times) == 0.5
+    irregular_times = [start_time, start_time + Minute(5), start_time + Minute(15)]
+    @test_throws ArgumentError(
+        "Times should have a consistent frequency"
+    ) NEMStorageUnderUncertainty._get_times_frequency_in_hours(irregular_times)
+end
+
 @testset "Run Forecast Data Tests" begin
     test_data_path = joinpath(@__DIR__, "test_data")
     (pd_df, p5_df) = NEMStorageUnderUncertainty.get_all_pd_and_p5_data(
@@ -111,3 +125,51 @@ end
         end
     end
 end
+
+@testset "Run Forecast Data Cache Tests" begin
+    test_data_path = joinpath(@__DIR__, "test_data")
+    (pd_path, p5_path) = (
+        joinpath(test_data_path, "forecast_price", "PREDISPATCH"),
+        joinpath(test_data_path, "forecast_price", "P5MIN"),
+    )
+    rtimes = (DateTime(2021, 1, 1, 4, 35, 0), DateTime(2021, 1, 1, 12, 0, 0))
+    cache_path = mktempdir()
+    cache_prefix = joinpath(cache_path, "NSW1_202101010435_202101011200")
+    (version, input_mtime) = (
+        NEMStorageUnderUncertainty.FORECAST_CACHE_VERSION,
+        NEMStorageUnderUncertainty._get_latest_parquet_mtime(pd_path, p5_path),
+    )
+    stale_caches = [
+        "$(cache_prefix)_v$(version - 1)_$(input_mtime).jld2",
+        "$(cache_prefix)_v$(version)_$(input_mtime - 1).jld2",
+    ]
+    stale_data = NEMStorageUnderUncertainty.ForecastData(
+        "NSW1", [rtimes[1]], [rtimes[1] + Minute(5)], [-1000.0], 5 / 60, true
+    )
+    for stale_cache in stale_caches
+        jldopen(stale_cache, "w") do f
+            f["forecast_data"] = stale_data
+        end
+    end
+    compiled = @test_logs(
+        (:info, r"Removing stale forecast data cache"),
+        (:info, r"Removing stale forecast data cache"),
+        NEMStorageUnderUncertainty.get_cached_ForecastData(
+            pd_path, p5_path, "NSW1", rtimes, cache_path
+        )
+    )
+    @test compiled.prices != stale_data.prices
+    @test !any(isfile.(stale_caches))
+    cache_file = "$(cache_prefix)_v$(version)_$(input_mtime).jld2"
+    @test readdir(cache_path; join=true) == [cache_file]
+    cache_mtime = mtime(cache_file)
+    cached = @test_logs(
+        (:info, r"Loading cached forecast data"),
+        NEMStorageUnderUncertainty.get_cached_ForecastData(
+            pd_path, p5_path, "NSW1", rtimes, cache_path
+        )
+    )
+    @test mtime(cache_file) == cache_mtime
+    @test convert(DataFrame, cached) == convert(DataFrame, compiled)
+    @test cached.τ == compiled.τ
+end
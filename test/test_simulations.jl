@@ -388,6 +388,37 @@ end
             @test isapprox(calc_soc, results[test_index + 1, :soc_mwh], atol=0.1)
         end
     end
+    @testset "Test revenue calculations with non binding decisions" begin
+        results = NEMStorageUnderUncertainty.simulate_storage_operation(
+            optimizer_with_attributes(HiGHS.Optimizer),
+            storage,
+            actual_data,
+            NEMStorageUnderUncertainty.StandardArbitrage(),
+            NEMStorageUnderUncertainty.NoDegradation();
+            decision_start_time=decision_start_time,
+            decision_end_time=decision_start_time + Hour(2),
+            binding=Minute(15),
+            horizon=Minute(30),
+            capture_all_decisions=true,
+        )
+        # reorder actual price data so that it is not sorted by time
+        shuffled_actual_data = all_actual_data[sortperm(all_actual_data.RRP), :]
+        unmodified_actual_data = copy(shuffled_actual_data)
+        sorted_results = sort(results, :simulated_time)
+        revenue = NEMStorageUnderUncertainty.calculate_actual_revenue(
+            results, shuffled_actual_data, actual_data.τ
+        )
+        @test isequal(shuffled_actual_data, unmodified_actual_data)
+        @test revenue.simulated_time == sorted_results.simulated_time
+        nonbinding_revenue = revenue[revenue.status .== "non binding", :revenue]
+        @test !isempty(nonbinding_revenue)
+        @test all(ismissing, nonbinding_revenue)
+        binding = revenue[revenue.status .== "binding", :]
+        @test all(!ismissing, binding.revenue)
+        @test binding.revenue ==
+            binding.actual_price .* (binding.discharge_mw .- binding.charge_mw) .*
+              actual_data.τ
+    end
 end
 
 @testset "Run Forecasted Data Simulation Tests" begin